@@ -5,6 +5,9 @@ from flask_smorest import Api
 from .models import db
 from .extensions import init_jwt
 from .config import configure_app
+from .outbox import OutboxWorker
+from .seat_index import init_seat_index
+from . import side_effects
 
 from .routes.health import blp as health_blp
 from .routes.auth import blp as auth_blp
@@ -12,6 +15,8 @@ from .routes.events import blp as events_blp
 from .routes.tickets import blp as tickets_blp
 from .routes.users import blp as users_blp
 from .routes.bookings import blp as bookings_blp
+from .routes.seatmap import blp as seatmap_blp
+from .routes.waitlist import blp as waitlist_blp
 
 # PUBLIC_INTERFACE
 def create_app(test_config=None):
@@ -36,6 +41,7 @@ def create_app(test_config=None):
         configure_app(app)
     db.init_app(app)
     init_jwt(app)
+    init_seat_index(app)
 
     api = Api(app)
     api.register_blueprint(health_blp)
@@ -44,4 +50,14 @@ def create_app(test_config=None):
     api.register_blueprint(tickets_blp)
     api.register_blueprint(users_blp)
     api.register_blueprint(bookings_blp)
+    api.register_blueprint(seatmap_blp)
+    api.register_blueprint(waitlist_blp)
+
+    # Development convenience: drain booking side effects inside the web process.
+    # In production run `python worker.py` alongside the web workers instead.
+    # Threads start on the first request, i.e. after serve.py has forked its
+    # workers: threads started in the preloading master would not survive the fork.
+    if app.config.get("OUTBOX_INPROCESS_WORKER"):
+        outbox_worker = app.extensions["outbox_worker"] = OutboxWorker(app)
+        app.before_request(outbox_worker.ensure_started)
     return app
@@ -41,3 +41,22 @@ def configure_app(app):
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY", "change_this_secret")
     app.config["PROPAGATE_EXCEPTIONS"] = True
+    # Seconds before an in-memory seat map is refreshed from the database in the background.
+    # 0 never refreshes, so other processes' bookings are not seen: single-process deployments only.
+    app.config["SEAT_INDEX_MAX_AGE"] = float(os.environ.get("SEAT_INDEX_MAX_AGE", 2.0))
+    # Those refreshes re-read availability only; seats and prices are re-read after this many seconds
+    app.config["SEAT_INDEX_LAYOUT_MAX_AGE"] = float(os.environ.get("SEAT_INDEX_LAYOUT_MAX_AGE", 300.0))
+    # Seat maps kept per process (least recently used are evicted); a 60k seat event takes ~6 MB
+    app.config["SEAT_INDEX_MAX_EVENTS"] = int(os.environ.get("SEAT_INDEX_MAX_EVENTS", 32))
+    # Seconds a waitlisted user has to claim a ticket freed by a cancellation
+    app.config["WAITLIST_CLAIM_SECONDS"] = int(os.environ.get("WAITLIST_CLAIM_SECONDS", 900))
+    # Outbox (booking side effects) worker settings
+    app.config["OUTBOX_INPROCESS_WORKER"] = os.environ.get("OUTBOX_INPROCESS_WORKER", "").lower() in ("1", "true", "yes")
+    app.config["OUTBOX_WORKER_THREADS"] = int(os.environ.get("OUTBOX_WORKER_THREADS", 2))
+    app.config["OUTBOX_BATCH_SIZE"] = int(os.environ.get("OUTBOX_BATCH_SIZE", 50))
+    app.config["OUTBOX_POLL_INTERVAL"] = float(os.environ.get("OUTBOX_POLL_INTERVAL", 1.0))
+    app.config["OUTBOX_MAX_ATTEMPTS"] = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", 5))
+    app.config["OUTBOX_RETRY_BASE_SECONDS"] = float(os.environ.get("OUTBOX_RETRY_BASE_SECONDS", 2.0))
+    # Finished (done/failed) tasks are deleted after this many days (0 keeps them), checked hourly
+    app.config["OUTBOX_RETENTION_DAYS"] = float(os.environ.get("OUTBOX_RETENTION_DAYS", 7))
+    app.config["OUTBOX_PURGE_INTERVAL"] = float(os.environ.get("OUTBOX_PURGE_INTERVAL", 3600.0))
@@ -1,8 +1,15 @@
+from datetime import datetime, timezone
+
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 
 db = SQLAlchemy()
 
+# PUBLIC_INTERFACE
+def utcnow():
+    """Naive UTC timestamp, matching how DateTime columns are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 # PUBLIC_INTERFACE
 class User(db.Model):
     """User model for authentication and booking."""
@@ -25,6 +32,8 @@ class Event(db.Model):
     title = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text, nullable=True)
     date = db.Column(db.DateTime, nullable=False)
+    # Waitlist position counter, incremented in place by each join (see waitlist.join)
+    waitlist_next_seq = db.Column(db.Integer, nullable=False, default=1, server_default="1")
     tickets = db.relationship('Ticket', backref='event', lazy=True)
 
 # PUBLIC_INTERFACE
@@ -44,3 +53,48 @@ class Booking(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     ticket_id = db.Column(db.Integer, db.ForeignKey('ticket.id'), nullable=False)
     booked_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+# PUBLIC_INTERFACE
+class OutboxTask(db.Model):
+    """
+    Durable side-effect task (email, ticket PDF, analytics, ...) written in the same
+    transaction as the change that caused it and drained later by app.outbox workers.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    event = db.Column(db.String(64), nullable=False)
+    handler = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(16), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+    __table_args__ = (
+        db.Index("ix_outbox_task_status_available_at", "status", "available_at"),
+    )
+
+# PUBLIC_INTERFACE
+class WaitlistEntry(db.Model):
+    """
+    A user's place in an event's FIFO waitlist. `seq` is allocated per event in join
+    order; positions are derived from it instead of counting rows. Once a cancelled
+    ticket is offered the entry holds it until `offer_expires_at`.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    seq = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(16), nullable=False, default="waiting")
+    # True while waiting/offered, NULL once finished: NULLs never collide in the
+    # unique constraint below, so each user has at most one active entry per event
+    is_active = db.Column(db.Boolean, nullable=True, default=True)
+    ticket_id = db.Column(db.Integer, db.ForeignKey('ticket.id'), nullable=True)
+    offer_expires_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+    __table_args__ = (
+        db.UniqueConstraint("event_id", "seq", name="uq_waitlist_entry_event_seq"),
+        db.UniqueConstraint("event_id", "user_id", "is_active", name="uq_waitlist_entry_event_user_active"),
+        db.Index("ix_waitlist_entry_event_status_seq", "event_id", "status", "seq"),
+    )
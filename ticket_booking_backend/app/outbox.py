@@ -0,0 +1,274 @@
+import json
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from sqlalchemy import delete, select, update
+
+from .models import db, OutboxTask, utcnow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BASE_SECONDS = 2.0
+DEFAULT_RETRY_MAX_SECONDS = 300.0
+DEFAULT_LEASE_SECONDS = 60.0
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_WORKER_THREADS = 2
+DEFAULT_RETENTION_DAYS = 7
+DEFAULT_PURGE_BATCH_SIZE = 1000
+DEFAULT_PURGE_INTERVAL = 3600.0
+
+# handler name -> callable(payload); event name -> [handler names]
+_handlers = {}
+_subscriptions = {}
+
+
+# PUBLIC_INTERFACE
+def handler(name, *events):
+    """
+    Register a side-effect handler under `name`, subscribed to the given events.
+    The handler is called with the decoded payload inside an app context.
+    """
+    def decorator(func):
+        _handlers[name] = func
+        for event in events:
+            names = _subscriptions.setdefault(event, [])
+            if name not in names:
+                names.append(name)
+        return func
+    return decorator
+
+
+# PUBLIC_INTERFACE
+def publish(event, payload, delay=None):
+    """
+    Stage one outbox task per handler subscribed to `event` in the current session.
+    Nothing is committed here: the tasks become durable with the caller's commit,
+    so side effects exist if and only if the booking change does. Handlers
+    receive `payload` with the event name added under "event". With `delay`
+    (seconds) the tasks are not run before that much time has passed.
+    """
+    body = json.dumps(dict(payload, event=event))
+    available_at = utcnow() + timedelta(seconds=delay or 0)
+    for name in _subscriptions.get(event, []):
+        db.session.add(OutboxTask(event=event, handler=name, payload=body, available_at=available_at))
+
+
+def _retry_delay(attempts, base, cap):
+    return min(cap, base * (2 ** (attempts - 1)))
+
+
+def _claim(batch_size, lease_seconds):
+    """
+    Lease up to `batch_size` due tasks. A claim bumps `attempts` and pushes
+    `available_at` out by the lease, guarded on the attempts value we read, so
+    concurrent workers (threads or processes) never run the same attempt twice
+    and a crashed worker's tasks become due again once the lease expires.
+    """
+    now = utcnow()
+    rows = db.session.execute(
+        select(OutboxTask.id, OutboxTask.attempts, OutboxTask.handler, OutboxTask.payload)
+        .where(OutboxTask.status == "pending", OutboxTask.available_at <= now)
+        .order_by(OutboxTask.available_at, OutboxTask.id)
+        .limit(batch_size)
+    ).all()
+    claimed = []
+    for task_id, attempts, name, payload in rows:
+        result = db.session.execute(
+            update(OutboxTask)
+            .where(OutboxTask.id == task_id, OutboxTask.status == "pending", OutboxTask.attempts == attempts)
+            .values(attempts=attempts + 1, available_at=now + timedelta(seconds=lease_seconds))
+        )
+        if result.rowcount == 1:
+            claimed.append((task_id, attempts + 1, name, payload))
+    db.session.commit()
+    return claimed
+
+
+def _renew_lease(task_id, attempts, lease_seconds):
+    """Extend the lease of a claimed task; False if another worker now owns it."""
+    result = db.session.execute(
+        update(OutboxTask)
+        .where(OutboxTask.id == task_id, OutboxTask.status == "pending", OutboxTask.attempts == attempts)
+        .values(available_at=utcnow() + timedelta(seconds=lease_seconds))
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+
+# PUBLIC_INTERFACE
+def drain_once(batch_size=DEFAULT_BATCH_SIZE, max_attempts=DEFAULT_MAX_ATTEMPTS,
+               retry_base=DEFAULT_RETRY_BASE_SECONDS, retry_max=DEFAULT_RETRY_MAX_SECONDS,
+               lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    Claim one batch of due tasks and run their handlers. Must be called inside an
+    app context. Failed tasks are rescheduled with exponential backoff and marked
+    "failed" after `max_attempts`. A single handler run must still fit within
+    `lease_seconds`. Returns the number of tasks processed.
+    """
+    claimed = _claim(batch_size, lease_seconds)
+    processed = 0
+    for task_id, attempts, name, payload in claimed:
+        # The batch runs sequentially, so renew this task's lease right before
+        # running it. If the lease already lapsed and another worker re-claimed
+        # the task (bumping attempts), skip it instead of running it twice.
+        if not _renew_lease(task_id, attempts, lease_seconds):
+            continue
+        processed += 1
+        # Handlers run outside any open transaction so slow side effects never
+        # hold database locks.
+        error = None
+        func = _handlers.get(name)
+        try:
+            if func is None:
+                raise LookupError(f"No outbox handler registered for {name!r}")
+            func(json.loads(payload))
+        except Exception as exc:
+            logger.exception("Outbox task %s (%s) failed on attempt %s", task_id, name, attempts)
+            db.session.rollback()
+            error = repr(exc)
+
+        values = {"status": "done", "last_error": None}
+        if error is not None:
+            values = {"last_error": error[:1000]}
+            if attempts >= max_attempts:
+                values["status"] = "failed"
+            else:
+                delay = _retry_delay(attempts, retry_base, retry_max)
+                values["available_at"] = utcnow() + timedelta(seconds=delay)
+        # Only the holder of this attempt may record its outcome
+        db.session.execute(
+            update(OutboxTask)
+            .where(OutboxTask.id == task_id, OutboxTask.attempts == attempts)
+            .values(**values)
+        )
+        db.session.commit()
+    return processed
+
+
+# PUBLIC_INTERFACE
+def purge(retention_days=DEFAULT_RETENTION_DAYS, batch_size=DEFAULT_PURGE_BATCH_SIZE):
+    """
+    Delete "done" and "failed" tasks whose last attempt is more than `retention_days`
+    old. Rows go in batches of `batch_size`, each in its own transaction, so a large
+    backlog never holds locks for long. Must be called inside an app context.
+    Returns the number of tasks deleted.
+    """
+    # available_at of a finished task is its last claim time: the status index covers it
+    cutoff = utcnow() - timedelta(days=retention_days)
+    deleted = 0
+    while True:
+        ids = db.session.execute(
+            select(OutboxTask.id)
+            .where(OutboxTask.status.in_(("done", "failed")), OutboxTask.available_at < cutoff)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return deleted
+        db.session.execute(delete(OutboxTask).where(OutboxTask.id.in_(ids)))
+        db.session.commit()
+        deleted += len(ids)
+
+
+# PUBLIC_INTERFACE
+class OutboxWorker:
+    """
+    Pool of threads draining the outbox in batches. Runs inside the web process
+    (OUTBOX_INPROCESS_WORKER, started by the first request so that a pre-forking
+    server does not start it in its master) for development, or standalone via
+    worker.py.
+    Settings default to the OUTBOX_* keys of the app config. Every
+    `purge_interval` seconds one of the threads also purges finished tasks older
+    than `retention_days` (0 disables it).
+    """
+
+    def __init__(self, app, threads=None, batch_size=None, poll_interval=None):
+        cfg = app.config
+        self.app = app
+        self.threads = threads or cfg.get("OUTBOX_WORKER_THREADS", DEFAULT_WORKER_THREADS)
+        self.poll_interval = poll_interval or cfg.get("OUTBOX_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)
+        self.drain_options = {
+            "batch_size": batch_size or cfg.get("OUTBOX_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+            "max_attempts": cfg.get("OUTBOX_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS),
+            "retry_base": cfg.get("OUTBOX_RETRY_BASE_SECONDS", DEFAULT_RETRY_BASE_SECONDS),
+            "retry_max": cfg.get("OUTBOX_RETRY_MAX_SECONDS", DEFAULT_RETRY_MAX_SECONDS),
+            "lease_seconds": cfg.get("OUTBOX_LEASE_SECONDS", DEFAULT_LEASE_SECONDS),
+        }
+        self.retention_days = cfg.get("OUTBOX_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+        self.purge_interval = cfg.get("OUTBOX_PURGE_INTERVAL", DEFAULT_PURGE_INTERVAL)
+        self._next_purge = 0.0
+        self._purge_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+        self._threads = []
+
+    def drain(self):
+        """Run a single batch in a fresh app context; returns tasks processed."""
+        with self.app.app_context():
+            try:
+                return drain_once(**self.drain_options)
+            except Exception:
+                logger.exception("Outbox drain failed")
+                db.session.rollback()
+                return 0
+
+    def purge(self):
+        """Delete expired finished tasks in a fresh app context; returns tasks deleted."""
+        if not self.retention_days:
+            return 0
+        with self.app.app_context():
+            try:
+                return purge(self.retention_days)
+            except Exception:
+                logger.exception("Outbox purge failed")
+                db.session.rollback()
+                return 0
+
+    def _purge_if_due(self):
+        if not self.retention_days or not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() >= self._next_purge:
+                self._next_purge = time.monotonic() + self.purge_interval
+                deleted = self.purge()
+                if deleted:
+                    logger.info("Purged %s finished outbox tasks", deleted)
+        finally:
+            self._purge_lock.release()
+
+    def run_forever(self):
+        """Drain until stop() is called, sleeping only when the outbox is empty."""
+        while not self._stop.is_set():
+            self._purge_if_due()
+            if self.drain() == 0:
+                self._stop.wait(self.poll_interval)
+
+    @property
+    def running(self):
+        """True between start() and stop()."""
+        return bool(self._threads)
+
+    def start(self):
+        """Start the worker threads (daemonic) and return immediately."""
+        self._stop.clear()
+        for i in range(self.threads):
+            t = threading.Thread(target=self.run_forever, name=f"outbox-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def ensure_started(self):
+        """Start the threads unless they are already running; safe to call concurrently."""
+        with self._start_lock:
+            if not self._threads:
+                self.start()
+
+    def stop(self, timeout=None):
+        """Signal the threads to finish their current batch and wait for them."""
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
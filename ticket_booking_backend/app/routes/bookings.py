@@ -4,6 +4,9 @@ from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models import db, Booking, Ticket
+from app.outbox import publish
+from app.seat_index import get_seat_index
+from app.waitlist import release_ticket, sync_seat_index
 
 blp = Blueprint("Bookings", "bookings", url_prefix="/bookings", description="Endpoints for ticket bookings")
 
@@ -38,10 +41,19 @@ class BookingList(MethodView):
 
         # Book the ticket (Booking.booked_at is auto-datetime)
         booking = Booking(user_id=user_id, ticket_id=ticket_id)
+        db.session.add(booking)
+        db.session.flush()
         ticket.is_booked = True
         ticket.booking_id = booking.id
-        db.session.add(booking)
+        # Side effects (email, ticket PDF, analytics) commit with the booking and run later
+        publish("booking.created", {
+            "booking_id": booking.id,
+            "user_id": user_id,
+            "ticket_id": ticket.id,
+            "event_id": ticket.event_id
+        })
         db.session.commit()
+        get_seat_index().set_booked(ticket.event_id, ticket.id, True)
         return {
             "booking_id": booking.id,
             "ticket_id": booking.ticket_id,
@@ -60,8 +72,15 @@ class BookingDetail(MethodView):
             abort(404, message="Booking not found")
         ticket = Ticket.query.get(booking.ticket_id)
         if ticket:
-            ticket.is_booked = False
-            ticket.booking_id = None
+            # Next waitlisted user (if any) gets the seat in this same transaction
+            release_ticket(ticket)
+        publish("booking.cancelled", {
+            "booking_id": booking.id,
+            "user_id": user_id,
+            "ticket_id": booking.ticket_id,
+            "event_id": ticket.event_id if ticket else None
+        })
         db.session.delete(booking)
         db.session.commit()
+        sync_seat_index(ticket)
         return {"message": "Booking cancelled"}, 200
@@ -2,7 +2,8 @@ from flask.views import MethodView
 from flask import request
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required
-from app.models import db, Event
+from app.models import db, Event, WaitlistEntry
+from app.seat_index import get_seat_index
 from datetime import datetime
 
 blp = Blueprint("Events", "events", url_prefix="/events", description="Events CRUD endpoints")
@@ -91,6 +92,8 @@ class EventDetail(MethodView):
         event = Event.query.get(event_id)
         if not event:
             abort(404, message="Event not found")
+        WaitlistEntry.query.filter_by(event_id=event_id).delete()
         db.session.delete(event)
         db.session.commit()
+        get_seat_index().invalidate(event_id)
         return {"message": "Event deleted"}, 200
@@ -0,0 +1,86 @@
+import base64
+import zlib
+
+from flask.views import MethodView
+from flask import request, make_response
+from flask_smorest import Blueprint, abort
+from app.models import Event
+from app.seat_index import get_seat_index
+
+blp = Blueprint("Seat Map", "seatmap", url_prefix="/events", description="Compact seat layout and availability bitmap per event")
+
+
+def load_event_seats(event_id):
+    """
+    Helper to fetch the seat index entry of an event, or abort with 404 if the event does not exist.
+    """
+    if not Event.query.get(event_id):
+        abort(404, message="Event not found")
+    return get_seat_index().get(event_id)
+
+# PUBLIC_INTERFACE
+@blp.route("/<int:event_id>/seatmap/layout")
+class SeatLayout(MethodView):
+    """
+    Static seat layout of an event, sent once and cached by the client.
+
+    Response: { "event_id": int, "version": str, "count": int,
+                "ticket_ids": [int], "seats": [str], "prices": [float] }
+    Array position is the seat ordinal used by the availability bitmap.
+    The version doubles as ETag; If-None-Match yields 304.
+    """
+    def get(self, event_id):
+        seats = load_event_seats(event_id)
+        if seats.version in request.if_none_match:
+            response = make_response("", 304)
+        else:
+            response = make_response(seats.layout(), 200)
+        response.set_etag(seats.version)
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response
+
+# PUBLIC_INTERFACE
+@blp.route("/<int:event_id>/seatmap/availability")
+class SeatAvailability(MethodView):
+    """
+    Seat availability as a bitmap: bit i (byte i >> 3, bit i & 7, LSB first) is 1 when
+    the seat with ordinal i is free.
+
+    Query params: format=base64 (default, JSON) | binary (application/octet-stream),
+                  compress=zlib (optional).
+    JSON response: { "event_id": int, "version": str, "count": int,
+                     "compression": str|null, "bitmap": str }
+    Binary responses carry version/count/compression in X-Layout-Version,
+    X-Seat-Count and X-Bitmap-Compression headers.
+    """
+    def get(self, event_id):
+        fmt = request.args.get("format", "base64")
+        compression = request.args.get("compress")
+        if fmt not in ("base64", "binary"):
+            abort(400, message="format must be 'base64' or 'binary'")
+        if compression not in (None, "zlib"):
+            abort(400, message="compress must be 'zlib'")
+
+        seats = load_event_seats(event_id)
+        bitmap = bytes(seats.bits)
+        if compression:
+            bitmap = zlib.compress(bitmap)
+
+        if fmt == "binary":
+            response = make_response(bitmap, 200)
+            response.mimetype = "application/octet-stream"
+            response.headers["X-Layout-Version"] = seats.version
+            response.headers["X-Seat-Count"] = str(len(seats))
+            if compression:
+                response.headers["X-Bitmap-Compression"] = compression
+        else:
+            response = make_response({
+                "event_id": event_id,
+                "version": seats.version,
+                "count": len(seats),
+                "compression": compression,
+                "bitmap": base64.b64encode(bitmap).decode("ascii")
+            }, 200)
+        response.cache_control.no_store = True
+        return response
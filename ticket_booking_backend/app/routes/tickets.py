@@ -3,6 +3,8 @@ from flask import request
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required
 from app.models import db, Ticket, Event
+from app.seat_index import get_seat_index
+from app.waitlist import release_ticket, requeue_offers
 
 blp = Blueprint("Tickets", "tickets", url_prefix="/tickets", description="Ticket management endpoints")
 
@@ -35,7 +37,11 @@ class TicketList(MethodView):
             seat=data.get("seat")
         )
         db.session.add(ticket)
+        db.session.flush()
+        # A new seat for a sold-out event goes to the head of its waitlist first
+        release_ticket(ticket)
         db.session.commit()
+        get_seat_index().invalidate(ticket.event_id)
         return {
             "id": ticket.id,
             "event_id": ticket.event_id,
@@ -71,6 +77,7 @@ class TicketDetail(MethodView):
         if "seat" in data:
             ticket.seat = data["seat"]
         db.session.commit()
+        get_seat_index().invalidate(ticket.event_id)
         return {
             "id": ticket.id,
             "event_id": ticket.event_id,
@@ -84,6 +91,9 @@ class TicketDetail(MethodView):
         ticket = Ticket.query.get(ticket_id)
         if not ticket:
             abort(404, message="Ticket not found")
+        event_id = ticket.event_id
+        requeue_offers(ticket)
         db.session.delete(ticket)
         db.session.commit()
+        get_seat_index().invalidate(event_id)
         return {"message": "Ticket deleted"}, 200
@@ -0,0 +1,145 @@
+from flask.views import MethodView
+from flask import request
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.exc import OperationalError
+
+from app.models import db, Booking, Event, Ticket, WaitlistEntry, utcnow
+from app.outbox import publish
+from app import waitlist
+
+blp = Blueprint("Waitlist", "waitlist", url_prefix="/waitlist", description="FIFO waitlist for sold-out events")
+
+
+def serialize_entry(entry):
+    """
+    Helper to render a waitlist entry together with its current queue position.
+    """
+    return {
+        "entry_id": entry.id,
+        "event_id": entry.event_id,
+        "status": entry.status,
+        "position": waitlist.position(entry),
+        "ticket_id": entry.ticket_id if entry.status == "offered" else None,
+        "offer_expires_at": entry.offer_expires_at.isoformat() if entry.status == "offered" else None
+    }
+
+
+def load_own_entry(entry_id, lock=False):
+    """
+    Helper to fetch the current user's waitlist entry, or abort with 404.
+    """
+    query = WaitlistEntry.query.filter_by(id=entry_id)
+    if lock:
+        query = query.with_for_update()
+    entry = query.first()
+    if not entry or entry.user_id != get_jwt_identity():
+        abort(404, message="Waitlist entry not found")
+    return entry
+
+# PUBLIC_INTERFACE
+@blp.route("/")
+class WaitlistList(MethodView):
+    """GET the current user's active waitlist entries, POST to join an event's waitlist."""
+    @jwt_required()
+    def get(self):
+        user_id = get_jwt_identity()
+        entries = (
+            WaitlistEntry.query
+            .filter(WaitlistEntry.user_id == user_id, WaitlistEntry.status.in_(waitlist.ACTIVE_STATUSES))
+            .order_by(WaitlistEntry.id)
+            .all()
+        )
+        return [serialize_entry(e) for e in entries], 200
+
+    @jwt_required()
+    def post(self):
+        """
+        Request body: { "event_id": int }
+        Response: { "entry_id": int, "event_id": int, "status": "waiting", "position": int, ... }
+        """
+        data = request.get_json()
+        user_id = get_jwt_identity()
+        event_id = data.get("event_id") if data else None
+        if not event_id:
+            abort(400, message="event_id is required")
+        if not Event.query.get(event_id):
+            abort(404, message="Event does not exist")
+        if not Ticket.query.filter_by(event_id=event_id).first():
+            abort(409, message="This event has no tickets yet")
+        if Ticket.query.filter_by(event_id=event_id, is_booked=False).first():
+            abort(409, message="Tickets are still available for this event")
+        active = WaitlistEntry.query.filter(
+            WaitlistEntry.event_id == event_id,
+            WaitlistEntry.user_id == user_id,
+            WaitlistEntry.status.in_(waitlist.ACTIVE_STATUSES)
+        ).first()
+        if active:
+            abort(409, message="Already on the waitlist for this event")
+        try:
+            entry = waitlist.join(event_id, user_id)
+        except OperationalError:
+            # Lock wait timeout/deadlock on the event's counter under heavy contention
+            db.session.rollback()
+            abort(503, message="The waitlist is busy, please retry")
+        if entry is None:
+            abort(409, message="Already on the waitlist for this event")
+        return serialize_entry(entry), 201
+
+# PUBLIC_INTERFACE
+@blp.route("/<int:entry_id>")
+class WaitlistDetail(MethodView):
+    """Get position/offer of a waitlist entry, or leave the waitlist (declining any offer)."""
+    @jwt_required()
+    def get(self, entry_id):
+        return serialize_entry(load_own_entry(entry_id)), 200
+
+    @jwt_required()
+    def delete(self, entry_id):
+        entry = load_own_entry(entry_id, lock=True)
+        if entry.status not in waitlist.ACTIVE_STATUSES:
+            abort(404, message="Waitlist entry not found")
+        ticket = waitlist.withdraw(entry, "left")
+        db.session.commit()
+        waitlist.sync_seat_index(ticket)
+        return {"message": "Left the waitlist"}, 200
+
+# PUBLIC_INTERFACE
+@blp.route("/<int:entry_id>/claim")
+class WaitlistClaim(MethodView):
+    """
+    Claim the ticket offered to this entry within its claim window.
+
+    Response: { "booking_id": int, "ticket_id": int, "booked_at": str }
+    """
+    @jwt_required()
+    def post(self, entry_id):
+        user_id = get_jwt_identity()
+        entry = load_own_entry(entry_id, lock=True)
+        if entry.status != "offered":
+            abort(409, message="No ticket is on offer for this entry")
+        ticket = Ticket.query.get(entry.ticket_id)
+        if entry.offer_expires_at <= utcnow() or not ticket:
+            released = waitlist.withdraw(entry, "expired")
+            db.session.commit()
+            waitlist.sync_seat_index(released)
+            abort(410, message="The offer has expired")
+
+        booking = Booking(user_id=user_id, ticket_id=ticket.id)
+        db.session.add(booking)
+        db.session.flush()
+        ticket.is_booked = True
+        ticket.booking_id = booking.id
+        waitlist.close(entry, "claimed")
+        publish("booking.created", {
+            "booking_id": booking.id,
+            "user_id": user_id,
+            "ticket_id": ticket.id,
+            "event_id": ticket.event_id
+        })
+        db.session.commit()
+        return {
+            "booking_id": booking.id,
+            "ticket_id": booking.ticket_id,
+            "booked_at": booking.booked_at.isoformat()
+        }, 201
@@ -0,0 +1,255 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+from .models import db, Ticket
+
+DEFAULT_MAX_AGE = 2.0
+DEFAULT_LAYOUT_MAX_AGE = 300.0
+DEFAULT_MAX_EVENTS = 32
+
+
+# is_booked 0/1 -> "1"/"0" digits (1 = free)
+_FREE_DIGITS = bytes.maketrans(b"\x00\x01", b"10")
+
+
+def _availability_bits(booked):
+    """Pack is_booked flags LSB first, 1 = free; done in C via one binary int parse."""
+    if not booked:
+        return bytearray()
+    digits = bytes(booked).translate(_FREE_DIGITS)[::-1]
+    return bytearray(int(digits, 2).to_bytes((len(booked) + 7) // 8, "little"))
+
+
+# PUBLIC_INTERFACE
+class EventSeats:
+    """
+    Seat layout and availability of one event.
+
+    Ordinals are positions in ticket-id order and stay stable until the layout
+    changes (ticket added, removed, re-seated or re-priced), which also changes
+    `version`. Availability bit i lives in byte i >> 3 at bit i & 7 (LSB first);
+    1 means the seat is free.
+    """
+
+    def __init__(self, event_id, rows):
+        self.event_id = event_id
+        self.ticket_ids = [r.id for r in rows]
+        self.seats = [r.seat for r in rows]
+        self.prices = [r.price for r in rows]
+        self.ordinal = {ticket_id: i for i, ticket_id in enumerate(self.ticket_ids)}
+        self.bits = _availability_bits([r.is_booked for r in rows])
+        digest = hashlib.sha1(json.dumps([self.ticket_ids, self.seats, self.prices]).encode())
+        self.version = digest.hexdigest()[:16]
+        self.built_at = self.layout_built_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.ticket_ids)
+
+    def set_booked(self, ticket_id, booked):
+        i = self.ordinal.get(ticket_id)
+        if i is None:
+            return
+        if booked:
+            self.bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+        else:
+            self.bits[i >> 3] |= 1 << (i & 7)
+
+    def layout(self):
+        """Static, cacheable part of the seat map as parallel arrays indexed by ordinal."""
+        return {
+            "event_id": self.event_id,
+            "version": self.version,
+            "count": len(self),
+            "ticket_ids": self.ticket_ids,
+            "seats": self.seats,
+            "prices": self.prices
+        }
+
+
+# PUBLIC_INTERFACE
+class SeatIndex:
+    """
+    Per-app registry of EventSeats, built lazily from the database and kept in
+    sync by the booking and ticket handlers. At most `max_events` events are
+    kept; the least recently used one is evicted and rebuilt on its next access.
+
+    Entries older than `max_age` seconds are refreshed in a background thread,
+    so changes made by other worker processes show up, while requests keep
+    being served from the current snapshot. A refresh re-reads only
+    (id, is_booked) into the existing ordinals; the full layout is rebuilt after
+    invalidate(), when the set of tickets changed, or once it is older than
+    `layout_max_age`. Only one build per event runs at a time. Changes that
+    land while a build is reading the database are not lost: set_booked calls
+    are journaled and replayed onto the new snapshot, and an invalidate bumps
+    the event's generation so the stale snapshot is discarded. With max_age=0
+    entries are only rebuilt after a layout change in this process, which is
+    correct only when a single process serves requests.
+    """
+
+    def __init__(self, max_age=DEFAULT_MAX_AGE, layout_max_age=DEFAULT_LAYOUT_MAX_AGE, max_events=DEFAULT_MAX_EVENTS):
+        self.max_age = max_age
+        self.layout_max_age = layout_max_age
+        self.max_events = max_events
+        self._events = OrderedDict()
+        self._generations = {}
+        self._journals = {}
+        self._build_locks = {}
+        self._lock = threading.Lock()
+
+    def _build_lock(self, event_id):
+        with self._lock:
+            return self._build_locks.setdefault(event_id, threading.Lock())
+
+    # Plain Core rows on the session's connection: ORM result processing would
+    # dominate the read for large events
+    @staticmethod
+    def _read(event_id):
+        return EventSeats(event_id, db.session.connection().execute(
+            db.select(Ticket.id, Ticket.seat, Ticket.price, Ticket.is_booked)
+            .where(Ticket.event_id == event_id)
+            .order_by(Ticket.id)
+        ).all())
+
+    @staticmethod
+    def _read_availability(event_id):
+        rows = db.session.connection().execute(
+            db.select(Ticket.id, Ticket.is_booked)
+            .where(Ticket.event_id == event_id)
+            .order_by(Ticket.id)
+        ).all()
+        ticket_ids, booked = zip(*rows) if rows else ((), ())
+        return list(ticket_ids), _availability_bits(booked)
+
+    def _store(self, event_id, seats):
+        """Insert or refresh an entry as most recently used; needs self._lock."""
+        self._events[event_id] = seats
+        self._events.move_to_end(event_id)
+        while len(self._events) > self.max_events:
+            self._events.popitem(last=False)
+
+    def _snapshot(self, event_id, read, apply):
+        """
+        Run `read(event_id)` without holding the lock, then `apply(result, journal)`
+        under it, unless a layout change raced with the read. Returns what `apply`
+        returns, or None if the snapshot was stale; needs the build lock.
+        """
+        with self._lock:
+            generation = self._generations.get(event_id, 0)
+            self._journals[event_id] = []
+        try:
+            result = read(event_id)
+        except BaseException:
+            with self._lock:
+                self._journals.pop(event_id, None)
+            raise
+        # The journal stays open until the result is applied, so no set_booked
+        # call can fall between the read and the swap
+        with self._lock:
+            journal = self._journals.pop(event_id, [])
+            if self._generations.get(event_id, 0) != generation:
+                return None
+            return apply(result, journal)
+
+    def _rebuild(self, event_id):
+        """Build a full snapshot (layout and availability) and store it."""
+        def apply(seats, journal):
+            for ticket_id, booked in journal:
+                seats.set_booked(ticket_id, booked)
+            self._store(event_id, seats)
+            return seats
+        return self._snapshot(event_id, self._read, apply)
+
+    def _refresh(self, event_id, seats):
+        """Re-read availability into the existing ordinals; rebuild if the layout went stale."""
+        if self.layout_max_age and time.monotonic() - seats.layout_built_at >= self.layout_max_age:
+            return self._rebuild(event_id)
+
+        def apply(result, journal):
+            ticket_ids, bits = result
+            # Tickets added or removed by another process: ordinals moved
+            if ticket_ids != seats.ticket_ids:
+                return None
+            seats.bits = bits
+            for ticket_id, booked in journal:
+                seats.set_booked(ticket_id, booked)
+            seats.built_at = time.monotonic()
+            return seats
+        return self._snapshot(event_id, self._read_availability, apply) or self._rebuild(event_id)
+
+    def _refresh_in_background(self, event_id, seats, build_lock):
+        app = current_app._get_current_object()
+
+        def run():
+            try:
+                with app.app_context():
+                    self._refresh(event_id, seats)
+            except Exception:
+                app.logger.exception("Seat index refresh failed for event %s", event_id)
+            finally:
+                build_lock.release()
+
+        threading.Thread(target=run, name=f"seat-index-{event_id}", daemon=True).start()
+
+    def get(self, event_id):
+        """Return the EventSeats for `event_id`, building it on first access."""
+        with self._lock:
+            seats = self._events.get(event_id)
+            if seats is not None:
+                self._events.move_to_end(event_id)
+        if seats is not None:
+            if self.max_age and time.monotonic() - seats.built_at >= self.max_age:
+                build_lock = self._build_lock(event_id)
+                if build_lock.acquire(blocking=False):
+                    self._refresh_in_background(event_id, seats, build_lock)
+            return seats
+
+        build_lock = self._build_lock(event_id)
+        with build_lock:
+            with self._lock:
+                seats = self._events.get(event_id)
+            # Built by a concurrent request while we waited: single flight
+            if seats is not None:
+                return seats
+            for _ in range(3):
+                seats = self._rebuild(event_id)
+                if seats is not None:
+                    return seats
+        # Layout kept changing under us; serve the latest read without caching it
+        return self._read(event_id)
+
+    def set_booked(self, event_id, ticket_id, booked):
+        """Flip one availability bit in place (and in any rebuild in progress)."""
+        with self._lock:
+            seats = self._events.get(event_id)
+            if seats is not None:
+                seats.set_booked(ticket_id, booked)
+            journal = self._journals.get(event_id)
+            if journal is not None:
+                journal.append((ticket_id, booked))
+
+    def invalidate(self, event_id):
+        """Drop an event after a layout change; it is rebuilt on next access."""
+        with self._lock:
+            self._events.pop(event_id, None)
+            self._generations[event_id] = self._generations.get(event_id, 0) + 1
+
+
+# PUBLIC_INTERFACE
+def init_seat_index(app):
+    """Attach a SeatIndex to the application."""
+    app.extensions["seat_index"] = SeatIndex(
+        app.config.get("SEAT_INDEX_MAX_AGE", DEFAULT_MAX_AGE),
+        app.config.get("SEAT_INDEX_LAYOUT_MAX_AGE", DEFAULT_LAYOUT_MAX_AGE),
+        app.config.get("SEAT_INDEX_MAX_EVENTS", DEFAULT_MAX_EVENTS)
+    )
+
+
+# PUBLIC_INTERFACE
+def get_seat_index():
+    """SeatIndex of the current application."""
+    return current_app.extensions["seat_index"]
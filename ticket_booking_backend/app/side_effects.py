@@ -0,0 +1,44 @@
+import logging
+
+from .outbox import handler
+
+logger = logging.getLogger(__name__)
+
+# Booking side effects, executed by app.outbox workers after the booking commits.
+# Delivery backends (SMTP, PDF rendering, analytics sink) are not wired up yet,
+# so these handlers log what they would send.
+
+
+# PUBLIC_INTERFACE
+@handler("booking_confirmation_email", "booking.created")
+def send_booking_confirmation(payload):
+    """Send the booking confirmation email to the user."""
+    logger.info("Booking confirmation email: booking=%s user=%s", payload["booking_id"], payload["user_id"])
+
+
+# PUBLIC_INTERFACE
+@handler("ticket_pdf", "booking.created")
+def render_ticket_pdf(payload):
+    """Render the ticket PDF for a new booking."""
+    logger.info("Ticket PDF: booking=%s ticket=%s", payload["booking_id"], payload["ticket_id"])
+
+
+# PUBLIC_INTERFACE
+@handler("booking_cancellation_email", "booking.cancelled")
+def send_cancellation_email(payload):
+    """Send the cancellation notice to the user."""
+    logger.info("Booking cancellation email: booking=%s user=%s", payload["booking_id"], payload["user_id"])
+
+
+# PUBLIC_INTERFACE
+@handler("waitlist_offer_email", "waitlist.offered")
+def send_waitlist_offer(payload):
+    """Tell a waitlisted user a ticket is held for them until the claim window ends."""
+    logger.info("Waitlist offer email: entry=%s user=%s ticket=%s", payload["entry_id"], payload["user_id"], payload["ticket_id"])
+
+
+# PUBLIC_INTERFACE
+@handler("analytics", "booking.created", "booking.cancelled")
+def track_booking_event(payload):
+    """Forward booking lifecycle events to analytics."""
+    logger.info("Analytics: %s booking=%s", payload["event"], payload["booking_id"])
@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from .models import db, Event, WaitlistEntry, Ticket, utcnow
+from .outbox import handler, publish
+from .seat_index import get_seat_index
+
+DEFAULT_CLAIM_SECONDS = 900
+ACTIVE_STATUSES = ("waiting", "offered")
+
+
+# PUBLIC_INTERFACE
+def join(event_id, user_id):
+    """
+    Append the user to the event's waitlist and commit. The `seq` comes from the
+    event's counter, bumped with an in-place UPDATE: the row lock it takes is held
+    until commit, so concurrent joins for one event queue behind each other and
+    never collide. Returns None if the user already has an active entry (enforced
+    by the (event_id, user_id, is_active) constraint, so a double submit cannot
+    create two). Lock timeouts surface as OperationalError.
+    """
+    db.session.execute(
+        update(Event).where(Event.id == event_id).values(waitlist_next_seq=Event.waitlist_next_seq + 1)
+    )
+    next_seq = db.session.execute(select(Event.waitlist_next_seq).where(Event.id == event_id)).scalar_one()
+    entry = WaitlistEntry(event_id=event_id, user_id=user_id, seq=next_seq - 1)
+    db.session.add(entry)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return None
+    return entry
+
+
+# PUBLIC_INTERFACE
+def position(entry):
+    """
+    1-based place in the queue for a waiting entry, else None. Computed from `seq` and
+    the head of the queue (one index seek), so it is O(1) regardless of queue length;
+    users who left from ahead are not subtracted, making it an upper bound.
+    """
+    if entry.status != "waiting":
+        return None
+    head = (
+        db.session.query(db.func.min(WaitlistEntry.seq))
+        .filter(WaitlistEntry.event_id == entry.event_id, WaitlistEntry.status == "waiting")
+        .scalar()
+    )
+    return entry.seq - head + 1
+
+
+# PUBLIC_INTERFACE
+def release_ticket(ticket):
+    """
+    Hand a freed (or newly added) ticket to the next waiting user of its event, or
+    make it available if nobody is waiting. Only stages changes; the caller commits,
+    so a cancellation and the promotion it triggers are one transaction. Returns the
+    offered entry or None.
+    """
+    ticket.booking_id = None
+    entry = (
+        WaitlistEntry.query
+        .filter_by(event_id=ticket.event_id, status="waiting")
+        .order_by(WaitlistEntry.seq)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if entry is None:
+        ticket.is_booked = False
+        return None
+
+    # The ticket stays marked booked while it is held for the waitlisted user
+    ticket.is_booked = True
+    claim_seconds = current_app.config.get("WAITLIST_CLAIM_SECONDS", DEFAULT_CLAIM_SECONDS)
+    entry.status = "offered"
+    entry.ticket_id = ticket.id
+    entry.offer_expires_at = utcnow() + timedelta(seconds=claim_seconds)
+    payload = {"entry_id": entry.id, "user_id": entry.user_id, "event_id": entry.event_id, "ticket_id": ticket.id}
+    publish("waitlist.offered", payload)
+    publish("waitlist.offer_expiry", payload, delay=claim_seconds)
+    return entry
+
+
+# PUBLIC_INTERFACE
+def close(entry, status):
+    """
+    Move an entry to a final `status` ("claimed", "left" or "expired"). The offered
+    ticket is unlinked so finished entries never pin a ticket row via the foreign key;
+    the resulting booking is the record of a claim.
+    """
+    entry.status = status
+    entry.is_active = None
+    entry.ticket_id = None
+
+
+# PUBLIC_INTERFACE
+def withdraw(entry, status):
+    """
+    Close an active entry ("left" or "expired"). A held ticket is passed on via
+    release_ticket. Returns that ticket (or None); the caller commits.
+    """
+    ticket = Ticket.query.get(entry.ticket_id) if entry.status == "offered" and entry.ticket_id else None
+    close(entry, status)
+    if ticket is not None and ticket.booking_id is None:
+        release_ticket(ticket)
+    return ticket
+
+
+# PUBLIC_INTERFACE
+def requeue_offers(ticket):
+    """
+    Before a ticket is deleted: entries holding it go back to waiting, keeping their
+    place at the head of the queue. The caller commits.
+    """
+    for entry in WaitlistEntry.query.filter_by(ticket_id=ticket.id).all():
+        entry.status = "waiting"
+        entry.ticket_id = None
+        entry.offer_expires_at = None
+
+
+# PUBLIC_INTERFACE
+def sync_seat_index(ticket):
+    """After commit: publish a ticket that ended up free to the in-memory seat map."""
+    if ticket is not None and not ticket.is_booked:
+        get_seat_index().set_booked(ticket.event_id, ticket.id, False)
+
+
+# PUBLIC_INTERFACE
+@handler("waitlist_offer_expiry", "waitlist.offer_expiry")
+def expire_offer(payload):
+    """Outbox task scheduled at the end of a claim window: pass an unclaimed ticket on."""
+    entry = WaitlistEntry.query.filter_by(id=payload["entry_id"]).with_for_update().first()
+    if entry is None or entry.status != "offered" or entry.offer_expires_at > utcnow():
+        db.session.rollback()
+        return
+    ticket = withdraw(entry, "expired")
+    db.session.commit()
+    sync_seat_index(ticket)
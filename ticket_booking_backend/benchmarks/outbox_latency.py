@@ -0,0 +1,100 @@
+"""
+Booking latency with slow side-effect handlers: inline vs. outbox.
+
+"inline" drains the outbox synchronously at the end of every request, i.e. what
+doing emails/PDFs/analytics inside BookingList.post would cost. "outbox" leaves
+them to an OutboxWorker pool running in the same process. Run from
+ticket_booking_backend/:
+
+    python -m benchmarks.outbox_latency --requests 100 --delays 0 20 100
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app import outbox
+from app.models import db, User, Event, Ticket, OutboxTask
+
+
+def _make_app(path):
+    return create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "JWT_SECRET_KEY": "bench-secret",
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        "OUTBOX_POLL_INTERVAL": 0.05,
+        "OUTBOX_WORKER_THREADS": 4,
+    })
+
+
+def _slow_handlers(delay):
+    # Re-register every existing handler name with a sleeping stand-in.
+    for name in list(outbox._handlers):
+        outbox.handler(name)(lambda payload: time.sleep(delay))
+
+
+def _run(mode, n_requests):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    app = _make_app(path)
+    with app.app_context():
+        db.create_all()
+        user = User(username="bench", email="bench@example.com")
+        user.set_password("bench")
+        event = Event(title="Bench", date=datetime(2030, 1, 1))
+        db.session.add_all([user, event])
+        db.session.flush()
+        db.session.add_all([Ticket(event_id=event.id, price=10.0, seat=f"S{i}") for i in range(n_requests)])
+        db.session.commit()
+        ticket_ids = [t.id for t in Ticket.query.order_by(Ticket.id)]
+        token = create_access_token(identity=user.id)
+
+    worker = None
+    if mode == "inline":
+        @app.after_request
+        def drain_inline(response):
+            while outbox.drain_once():
+                pass
+            return response
+    else:
+        worker = outbox.OutboxWorker(app).start()
+
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+    for ticket_id in ticket_ids:
+        start = time.perf_counter()
+        res = client.post("/bookings/", json={"ticket_id": ticket_id}, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert res.status_code == 201, res.get_json()
+
+    if worker is not None:
+        with app.app_context():
+            while OutboxTask.query.filter_by(status="pending").count():
+                time.sleep(0.05)
+        worker.stop()
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--delays", type=float, nargs="+", default=[0, 20, 100], help="handler delay in ms")
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'handler ms':>12}{'p50 ms':>10}{'p95 ms':>10}")
+    for delay in args.delays:
+        _slow_handlers(delay / 1000)
+        for mode in ("inline", "outbox"):
+            p50, p95 = _run(mode, args.requests)
+            print(f"{mode:<8}{delay:>12.0f}{p50:>10.2f}{p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
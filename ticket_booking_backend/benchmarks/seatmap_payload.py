@@ -0,0 +1,93 @@
+"""
+Seat map payload size and server time: GET /tickets vs. the seat map endpoints.
+
+Builds one event with N tickets (a fraction of them booked) in a temporary
+SQLite database and times each endpoint through the test client, using the
+default SEAT_INDEX_MAX_AGE. The last row polls slower than that interval, so
+every request finds a stale snapshot and triggers a background refresh. Run from
+ticket_booking_backend/:
+
+    python -m benchmarks.seatmap_payload --seats 60000 --booked 0.6
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from app import create_app
+from app.models import db, Event, Ticket
+from app.seat_index import DEFAULT_MAX_AGE
+
+
+def _time(client, url, repeat):
+    client.get(url)  # warm the seat index / caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        res = client.get(url)
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+    assert res.status_code == 200, res.status_code
+    return len(res.data), elapsed
+
+
+def _time_stale(client, url, repeat):
+    """Polls spaced beyond the refresh interval, i.e. each one finds its snapshot stale."""
+    client.get(url)
+    elapsed = 0.0
+    for _ in range(repeat):
+        time.sleep(DEFAULT_MAX_AGE + 0.5)
+        start = time.perf_counter()
+        res = client.get(url)
+        elapsed += time.perf_counter() - start
+    assert res.status_code == 200, res.status_code
+    return len(res.data), elapsed * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seats", type=int, default=60000)
+    parser.add_argument("--booked", type=float, default=0.6, help="fraction of seats booked")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "JWT_SECRET_KEY": "bench-secret",
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+    })
+    rng = random.Random(42)
+    with app.app_context():
+        db.create_all()
+        event = Event(title="Arena", date=datetime(2030, 1, 1))
+        db.session.add(event)
+        db.session.flush()
+        db.session.execute(db.insert(Ticket), [
+            {"event_id": event.id, "price": 50.0 + (i // 1000) * 5, "seat": f"S{i // 100}-R{i % 100}",
+             "is_booked": rng.random() < args.booked}
+            for i in range(args.seats)
+        ])
+        db.session.commit()
+        event_id = event.id
+
+    client = app.test_client()
+    urls = [
+        ("GET /tickets", "/tickets/"),
+        ("layout (once, cacheable)", f"/events/{event_id}/seatmap/layout"),
+        ("availability base64", f"/events/{event_id}/seatmap/availability"),
+        ("availability binary", f"/events/{event_id}/seatmap/availability?format=binary"),
+        ("availability binary+zlib", f"/events/{event_id}/seatmap/availability?format=binary&compress=zlib"),
+    ]
+    print(f"{args.seats} seats, {args.booked:.0%} booked")
+    print(f"{'endpoint':<28}{'bytes':>12}{'ms':>10}")
+    for label, url in urls:
+        size, ms = _time(client, url, args.repeat)
+        print(f"{label:<28}{size:>12}{ms:>10.2f}")
+    size, ms = _time_stale(client, urls[3][1], args.repeat)
+    print(f"{'binary, poll every ' + str(DEFAULT_MAX_AGE + 0.5) + 's':<28}{size:>12}{ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Throughput of Flask's development server (run.py / app.run()) vs. serve.py.
+
+Starts each server as a subprocess against a temporary SQLite database seeded
+with a few events, then drives GET /events/ for a fixed duration from a load
+generator in separate processes: wrk if it is on PATH, else --clients Python
+processes running keep-alive client threads. With two or more CPUs the server
+and the load generator are pinned to disjoint CPUs (--server-cpus); on a
+single CPU they compete for it and the numbers only show relative overhead,
+not server capacity. A few errors under serve.py are keep-alive connections
+closed by max-requests worker recycling (WEB_MAX_REQUESTS=0 turns it off).
+Run from ticket_booking_backend/:
+
+    python -m benchmarks.server_throughput --duration 10 --concurrency 16
+"""
+import argparse
+import http.client
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from app import create_app
+from app.models import db, Event
+
+
+def _seed(uri):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": uri, "SQLALCHEMY_TRACK_MODIFICATIONS": False})
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Event(title=f"Event {i}", date=datetime(2030, 1, 1)) for i in range(20)])
+        db.session.commit()
+
+
+def _wait_ready(port, proc, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/")
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def _pin(cpus):
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+
+def _client_process(port, duration, threads, cpus, results):
+    """One load generator process: `threads` keep-alive connections, totals put on `results`."""
+    _pin(cpus)
+    counts = [0] * threads
+    errors = [0] * threads
+    stop_at = time.time() + duration
+
+    def client(i):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        while time.time() < stop_at:
+            try:
+                conn.request("GET", "/events/")
+                res = conn.getresponse()
+                res.read()
+                if res.status == 200:
+                    counts[i] += 1
+                else:
+                    errors[i] += 1
+                if res.will_close:
+                    conn.close()
+            except (OSError, http.client.HTTPException):
+                errors[i] += 1
+                conn.close()
+
+    workers = [threading.Thread(target=client, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    results.put((sum(counts), sum(errors)))
+
+
+def _load_python(port, duration, concurrency, clients, cpus):
+    results = multiprocessing.Queue()
+    per_client = [concurrency // clients + (i < concurrency % clients) for i in range(clients)]
+    procs = [
+        multiprocessing.Process(target=_client_process, args=(port, duration, n, cpus, results))
+        for n in per_client if n
+    ]
+    for p in procs:
+        p.start()
+    totals = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return sum(ok for ok, _ in totals) / duration, sum(err for _, err in totals)
+
+
+def _load_wrk(wrk, port, duration, concurrency, clients, cpus):
+    out = subprocess.run(
+        [wrk, "-t", str(min(clients, concurrency)), "-c", str(concurrency), "-d", f"{duration:.0f}s",
+         f"http://127.0.0.1:{port}/events/"],
+        capture_output=True, text=True, check=True, preexec_fn=lambda: _pin(cpus)
+    ).stdout
+    rps = float(re.search(r"Requests/sec:\s+([\d.]+)", out).group(1))
+    errors = sum(int(n) for n in re.findall(r"(?:connect|read|write|timeout) (\d+)", out))
+    errors += int(m.group(1)) if (m := re.search(r"Non-2xx or 3xx responses: (\d+)", out)) else 0
+    return rps, errors
+
+
+def _split_cpus(server_cpus):
+    """(server CPUs, client CPUs); None means unpinned."""
+    available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+    if len(available) < 2:
+        return None, None
+    n = server_cpus or len(available) // 2
+    n = max(1, min(n, len(available) - 1))
+    return set(available[:n]), set(available[n:])
+
+
+def main():
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16, help="open keep-alive connections in total")
+    parser.add_argument("--clients", type=int, default=max(2, cpus // 2), help="load generator processes")
+    parser.add_argument("--server-cpus", type=int, help="CPUs reserved for the server (default: half)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--no-wrk", action="store_true", help="use the Python load generator even if wrk is installed")
+    args = parser.parse_args()
+
+    uri = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    _seed(uri)
+    env = dict(os.environ, DATABASE_URI_OVERRIDE=uri, JWT_SECRET_KEY="bench-secret")
+    servers = [
+        ("app.run()", [sys.executable, "-c", f"from run import app; app.run(port={args.port})"]),
+        (f"serve.py {args.workers}w x {args.threads}t",
+         [sys.executable, "serve.py", "--bind", f"127.0.0.1:{args.port}",
+          "--workers", str(args.workers), "--threads", str(args.threads)]),
+    ]
+    server_cpus, client_cpus = _split_cpus(args.server_cpus)
+    wrk = None if args.no_wrk else shutil.which("wrk")
+    generator = f"wrk, {args.clients} threads" if wrk else f"{args.clients} Python client processes"
+
+    print(f"GET /events/, {args.concurrency} keep-alive connections, {args.duration:.0f}s, load from {generator}")
+    if server_cpus:
+        print(f"{cpus} CPUs: server pinned to {sorted(server_cpus)}, load generator to {sorted(client_cpus)}")
+    else:
+        print(f"WARNING: {cpus} CPU available; server and load generator share it, so these numbers "
+              "compare per-request overhead only, not how either server scales across cores")
+    print(f"{'server':<24}{'req/s':>10}{'errors':>8}")
+    for label, cmd in servers:
+        proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                preexec_fn=lambda: _pin(server_cpus))
+        try:
+            _wait_ready(args.port, proc)
+            if wrk:
+                rps, errors = _load_wrk(wrk, args.port, args.duration, args.concurrency, args.clients, client_cpus)
+            else:
+                rps, errors = _load_python(args.port, args.duration, args.concurrency, args.clients, client_cpus)
+        finally:
+            proc.terminate()
+            proc.wait()
+        print(f"{label:<24}{rps:>10.0f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import argparse
+import multiprocessing
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event as sa_event
+from werkzeug.security import generate_password_hash
+
+from app.config import get_database_uri
+from app.models import db, User, Event, Ticket, Booking
+
+BASE_DATE = datetime(2025, 1, 1)
+SEATS_PER_ROW = 25
+ROWS_PER_SECTION = 20
+MAX_VENUE_WEIGHT = 50
+PRICE_TIERS = (180.0, 120.0, 85.0, 60.0, 40.0)
+TITLE_WORDS = (
+    "Live", "Summer", "Night", "Tour", "Festival", "Symphony", "Jazz", "Rock", "Comedy",
+    "Derby", "Final", "Gala", "Opera", "Ballet", "Arena", "Acoustic", "Classics", "Open Air"
+)
+
+
+def _engine(uri):
+    """Engine for bulk loading; MySQL FK checks are off because Ticket and Booking reference each other."""
+    connect_args = {"timeout": 60} if uri.startswith("sqlite") else {}
+    engine = create_engine(uri, connect_args=connect_args)
+    if engine.dialect.name == "mysql":
+        @sa_event.listens_for(engine, "connect")
+        def _disable_fk_checks(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("SET FOREIGN_KEY_CHECKS=0")
+            cursor.close()
+    return engine
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _ratio(value):
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {value}")
+    return number
+
+
+def _event_rng(seed, table, key):
+    # Seeded per row group, so output does not depend on partitioning or worker count
+    return random.Random(f"{seed}:{table}:{key}")
+
+
+# PUBLIC_INTERFACE
+def plan_events(n_events, n_tickets, booking_ratio, seed):
+    """
+    Decide every event's capacity and sold fraction up front.
+
+    Venue sizes follow a capped Pareto distribution scaled to roughly `n_tickets` seats in
+    total; demand follows a Zipf law over a random popularity ranking, so a few hit events
+    sell out while the long tail stays mostly empty. Demand is scaled so the expected share
+    of booked seats equals `booking_ratio`.
+    Returns (capacities, sold_fractions).
+    """
+    rng = _event_rng(seed, "plan", 0)
+    weights = [min(rng.paretovariate(1.2), MAX_VENUE_WEIGHT) for _ in range(n_events)]
+    scale = n_tickets / sum(weights)
+    capacities = [max(1, round(w * scale)) for w in weights]
+
+    ranks = list(range(n_events))
+    rng.shuffle(ranks)
+    demand = [1.0 / (r + 1) ** 0.8 for r in ranks]
+    # Bisect the demand multiplier so booked seats / all seats == booking_ratio
+    target = booking_ratio * sum(capacities)
+    lo, hi = 0.0, 1.0 / min(demand)
+    for _ in range(40):
+        k = (lo + hi) / 2
+        if sum(c * min(1.0, k * d) for c, d in zip(capacities, demand)) < target:
+            lo = k
+        else:
+            hi = k
+    sold = [min(1.0, hi * d) for d in demand]
+    return capacities, sold
+
+
+def _insert(engine, batches):
+    """Insert [(table, rows), ...] in one transaction."""
+    with engine.begin() as conn:
+        for table, rows in batches:
+            if rows:
+                conn.execute(table.insert(), rows)
+
+
+def _seed_users(job):
+    uri, seed, first_id, last_id, chunk_size, password_hash = job
+    engine = _engine(uri)
+    rows = []
+    for user_id in range(first_id, last_id):
+        rows.append({"id": user_id, "username": f"user{user_id}", "email": f"user{user_id}@example.com",
+                     "password_hash": password_hash})
+        if len(rows) >= chunk_size:
+            _insert(engine, [(User.__table__, rows)])
+            rows = []
+    _insert(engine, [(User.__table__, rows)])
+    engine.dispose()
+    return {"users": last_id - first_id}
+
+
+def _seed_events(job):
+    uri, seed, first_id, last_id, chunk_size = job
+    engine = _engine(uri)
+    rows = []
+    for event_id in range(first_id, last_id):
+        rng = _event_rng(seed, "event", event_id)
+        title = " ".join(rng.sample(TITLE_WORDS, 2))
+        rows.append({"id": event_id, "title": f"{title} #{event_id}", "description": None,
+                     "date": BASE_DATE + timedelta(days=rng.randrange(365), hours=rng.choice((14, 18, 19, 20)))})
+        if len(rows) >= chunk_size:
+            _insert(engine, [(Event.__table__, rows)])
+            rows = []
+    _insert(engine, [(Event.__table__, rows)])
+    engine.dispose()
+    return {"events": last_id - first_id}
+
+
+def _seed_tickets(job):
+    """Tickets and their bookings for a contiguous range of events; booking id == ticket id."""
+    uri, seed, first_event_id, first_ticket_id, capacities, sold, n_users, chunk_size = job
+    engine = _engine(uri)
+    tickets, bookings = [], []
+    counts = {"tickets": 0, "bookings": 0}
+    ticket_id = first_ticket_id
+    sales_close = BASE_DATE + timedelta(days=365)
+    for offset, (capacity, sold_fraction) in enumerate(zip(capacities, sold)):
+        event_id = first_event_id + offset
+        rng = _event_rng(seed, "tickets", event_id)
+        for n in range(capacity):
+            section, row, seat = n // (ROWS_PER_SECTION * SEATS_PER_ROW), (n // SEATS_PER_ROW) % ROWS_PER_SECTION, n % SEATS_PER_ROW
+            booked = rng.random() < sold_fraction
+            tickets.append({"id": ticket_id, "event_id": event_id,
+                            "price": PRICE_TIERS[min(section, len(PRICE_TIERS) - 1)],
+                            "seat": f"S{section + 1}-R{row + 1}-{seat + 1}",
+                            "is_booked": booked, "booking_id": ticket_id if booked else None})
+            if booked:
+                # Heavy users: squaring skews purchases towards low user ids
+                bookings.append({"id": ticket_id, "ticket_id": ticket_id,
+                                 "user_id": int(n_users * rng.random() ** 2) + 1,
+                                 "booked_at": sales_close - timedelta(minutes=rng.randrange(60 * 24 * 365))})
+            ticket_id += 1
+            if len(tickets) >= chunk_size:
+                _insert(engine, [(Ticket.__table__, tickets), (Booking.__table__, bookings)])
+                counts["tickets"] += len(tickets)
+                counts["bookings"] += len(bookings)
+                tickets, bookings = [], []
+    _insert(engine, [(Ticket.__table__, tickets), (Booking.__table__, bookings)])
+    counts["tickets"] += len(tickets)
+    counts["bookings"] += len(bookings)
+    engine.dispose()
+    return counts
+
+
+def _id_ranges(total, parts):
+    size = max(1, -(-total // parts))
+    return [(lo + 1, min(lo + size, total) + 1) for lo in range(0, total, size)]
+
+
+def _run_phase(label, func, jobs, pool):
+    start = time.perf_counter()
+    results = pool.imap_unordered(func, jobs) if pool else map(func, jobs)
+    totals = {}
+    for counts in results:
+        for table, n in counts.items():
+            totals[table] = totals.get(table, 0) + n
+    elapsed = time.perf_counter() - start
+    rows = sum(totals.values())
+    detail = ", ".join(f"{n:,} {table}" for table, n in totals.items())
+    print(f"{label:<18}{rows:>12,} rows {elapsed:>9.2f} s {rows / elapsed if elapsed else 0:>12,.0f} rows/s  ({detail})")
+    return rows, elapsed
+
+
+# PUBLIC_INTERFACE
+def seed_database(uri, users, events, tickets, booking_ratio=0.6, seed=1, chunk_size=5000, workers=1, reset=False):
+    """
+    Generate a deterministic synthetic dataset with bulk Core inserts in chunked transactions.
+    Explicit primary keys let partitions of each table load in parallel processes; the same
+    seed always yields the same rows, whatever the worker count. All users share the
+    password "password". Returns total rows inserted.
+    """
+    if min(users, events, tickets, chunk_size, workers) < 1:
+        raise ValueError("users, events, tickets, chunk_size and workers must be positive")
+    engine = _engine(uri)
+    if reset:
+        db.metadata.drop_all(engine)
+    db.metadata.create_all(engine)
+    engine.dispose()
+
+    capacities, sold = plan_events(events, tickets, booking_ratio, seed)
+    ticket_starts = [1]
+    for capacity in capacities[:-1]:
+        ticket_starts.append(ticket_starts[-1] + capacity)
+    parts = workers * 8
+    # One hash for everybody: per-user hashing would dominate the run time
+    password_hash = generate_password_hash("password")
+
+    user_jobs = [(uri, seed, lo, hi, chunk_size, password_hash) for lo, hi in _id_ranges(users, parts)]
+    event_jobs = [(uri, seed, lo, hi, chunk_size) for lo, hi in _id_ranges(events, parts)]
+    ticket_jobs = [
+        (uri, seed, lo, ticket_starts[lo - 1], capacities[lo - 1:hi - 1], sold[lo - 1:hi - 1], users, chunk_size)
+        for lo, hi in _id_ranges(events, parts)
+    ]
+
+    print(f"Seeding {uri.split('@')[-1]} with seed={seed}, workers={workers}, chunk={chunk_size}")
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        total_rows, total_time = 0, 0.0
+        for label, func, jobs in (("users", _seed_users, user_jobs),
+                                  ("events", _seed_events, event_jobs),
+                                  ("tickets+bookings", _seed_tickets, ticket_jobs)):
+            rows, elapsed = _run_phase(label, func, jobs, pool)
+            total_rows += rows
+            total_time += elapsed
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    print(f"{'total':<18}{total_rows:>12,} rows {total_time:>9.2f} s {total_rows / total_time:>12,.0f} rows/s")
+    return total_rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed the database with synthetic users, events, tickets and bookings")
+    parser.add_argument("--users", type=_positive_int, default=100000)
+    parser.add_argument("--events", type=_positive_int, default=1000)
+    parser.add_argument("--tickets", type=_positive_int, default=1000000, help="approximate total number of seats")
+    parser.add_argument("--booking-ratio", type=_ratio, default=0.6, help="target fraction of seats booked")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--chunk-size", type=_positive_int, default=5000, help="rows per insert transaction")
+    parser.add_argument("--workers", type=_positive_int, default=1, help="parallel loader processes")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    parser.add_argument("--database-uri", help="defaults to the app's MYSQL_* / DATABASE_URI_OVERRIDE settings")
+    args = parser.parse_args()
+    seed_database(args.database_uri or get_database_uri(), args.users, args.events, args.tickets,
+                  booking_ratio=args.booking_ratio, seed=args.seed, chunk_size=args.chunk_size,
+                  workers=args.workers, reset=args.reset)
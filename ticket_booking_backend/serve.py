@@ -0,0 +1,93 @@
+import argparse
+import multiprocessing
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from app import create_app
+from app.models import db
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value and value.strip() else default
+
+
+class _PreforkServer(BaseApplication):
+    """Gunicorn application serving an already created (preloaded) Flask app."""
+
+    def __init__(self, application, options):
+        self.application = application
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+
+# PUBLIC_INTERFACE
+def build_options(args, app):
+    """
+    Translate CLI arguments into gunicorn settings. With preloading, create_app runs
+    once in the master and workers fork from it; each worker then disposes the
+    inherited SQLAlchemy pool so no connection is shared across processes.
+    """
+    def post_fork(server, worker):
+        with app.app_context():
+            db.engine.dispose(close=False)
+
+    return {
+        "bind": args.bind,
+        "workers": args.workers,
+        "threads": args.threads,
+        # gthread even with one thread: the sync worker ignores keepalive
+        "worker_class": "gthread",
+        "keepalive": args.keepalive,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests_jitter,
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "preload_app": True,
+        "pidfile": args.pidfile,
+        "accesslog": args.access_log,
+        "post_fork": post_fork,
+    }
+
+
+# PUBLIC_INTERFACE
+def serve():
+    """
+    Production entry point: runs create_app() under gunicorn's pre-forking server.
+    Every option falls back to an environment variable (shown in --help).
+
+    Graceful reload: `kill -HUP $(cat <pidfile>)` forks fresh workers and retires the
+    old ones after their in-flight requests finish (up to --graceful-timeout). As the
+    app is preloaded in the master, code changes need a full restart.
+    """
+    parser = argparse.ArgumentParser(description="Run the API under a pre-forking WSGI server")
+    parser.add_argument("--bind", default=os.environ.get("BIND", "0.0.0.0:5000"), help="BIND")
+    parser.add_argument("--workers", type=int, default=_env_int("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1),
+                        help="WEB_CONCURRENCY (default: 2 * CPUs + 1)")
+    parser.add_argument("--threads", type=int, default=_env_int("WEB_THREADS", 1), help="WEB_THREADS per gthread worker")
+    parser.add_argument("--keepalive", type=int, default=_env_int("WEB_KEEPALIVE", 5),
+                        help="WEB_KEEPALIVE seconds an idle keep-alive connection stays open")
+    parser.add_argument("--max-requests", type=int, default=_env_int("WEB_MAX_REQUESTS", 1000),
+                        help="WEB_MAX_REQUESTS before a worker is recycled (0 disables)")
+    parser.add_argument("--max-requests-jitter", type=int, default=_env_int("WEB_MAX_REQUESTS_JITTER", 100),
+                        help="WEB_MAX_REQUESTS_JITTER")
+    parser.add_argument("--timeout", type=int, default=_env_int("WEB_TIMEOUT", 30), help="WEB_TIMEOUT seconds")
+    parser.add_argument("--graceful-timeout", type=int, default=_env_int("WEB_GRACEFUL_TIMEOUT", 30),
+                        help="WEB_GRACEFUL_TIMEOUT seconds")
+    parser.add_argument("--pidfile", default=os.environ.get("WEB_PIDFILE"), help="WEB_PIDFILE")
+    parser.add_argument("--access-log", default=os.environ.get("WEB_ACCESS_LOG"), help="WEB_ACCESS_LOG ('-' for stdout)")
+    args = parser.parse_args()
+
+    app = create_app()
+    _PreforkServer(app, build_options(args, app)).run()
+
+if __name__ == "__main__":
+    serve()
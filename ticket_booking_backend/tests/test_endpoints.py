@@ -1,6 +1,17 @@
+import base64
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import pytest
-from app import create_app
-from app.models import db
+from sqlalchemy import event as sa_event, text
+
+from app import create_app, outbox, waitlist
+from app.models import db, OutboxTask, Ticket, WaitlistEntry, utcnow
+from app.outbox import drain_once
+from app.seat_index import SeatIndex
 
 # Utilities to help with authentication headers etc.
 def auth_header(token):
@@ -246,3 +257,423 @@ def test_booking_only_own(client, user_token):
     # User2 tries delete other's booking
     res = client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(token2))
     assert res.status_code == 404
+
+# -------- OUTBOX (booking side effects) ----------
+def test_booking_side_effects_enqueued_and_drained(app, client, user_token):
+    event = client.post("/events/", json={"title": "E4", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    ticket = client.post("/tickets/", json={"event_id": event["id"], "price": 12.0}, headers=auth_header(user_token)).get_json()
+    booking = client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(user_token)).get_json()
+    client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(user_token))
+
+    with app.app_context():
+        tasks = OutboxTask.query.all()
+        assert {(t.event, t.handler) for t in tasks} == {
+            ("booking.created", "booking_confirmation_email"),
+            ("booking.created", "ticket_pdf"),
+            ("booking.created", "analytics"),
+            ("booking.cancelled", "booking_cancellation_email"),
+            ("booking.cancelled", "analytics"),
+        }
+        assert drain_once() == 5
+        assert drain_once() == 0
+        assert all(t.status == "done" and t.attempts == 1 for t in OutboxTask.query.all())
+
+def test_outbox_retries_with_backoff_then_fails(app):
+    calls = []
+
+    @outbox.handler("flaky", "test.flaky")
+    def flaky(payload):
+        calls.append(payload)
+        raise RuntimeError("smtp down")
+
+    with app.app_context():
+        outbox.publish("test.flaky", {"n": 1})
+        db.session.commit()
+        assert outbox.drain_once(max_attempts=2, retry_base=60) == 1
+        task = OutboxTask.query.one()
+        assert task.status == "pending" and task.attempts == 1 and "smtp down" in task.last_error
+        assert task.available_at > utcnow()
+        # Not due yet: backoff keeps it out of the next batch
+        assert outbox.drain_once(max_attempts=2) == 0
+
+        task.available_at = utcnow()
+        db.session.commit()
+        assert outbox.drain_once(max_attempts=2) == 1
+        assert OutboxTask.query.one().status == "failed"
+        assert calls == [{"n": 1, "event": "test.flaky"}] * 2
+
+def test_outbox_skips_tasks_whose_lease_lapsed_mid_batch(app):
+    calls = []
+
+    @outbox.handler("slow", "test.slow")
+    def slow(payload):
+        calls.append(payload["n"])
+        if len(calls) == 1:
+            # The batch outlived its lease and another worker re-claimed and ran what was left
+            OutboxTask.query.filter(OutboxTask.id != 1).update({"available_at": utcnow() - timedelta(seconds=1)})
+            db.session.commit()
+            assert drain_once(batch_size=10) == 2
+
+    with app.app_context():
+        for n in range(3):
+            outbox.publish("test.slow", {"n": n})
+        db.session.commit()
+        # Only the first task is still ours; the other worker's outcomes are not overwritten
+        assert drain_once(batch_size=3) == 1
+        assert calls == [0, 1, 2]
+        tasks = OutboxTask.query.order_by(OutboxTask.id).all()
+        assert [(t.status, t.attempts) for t in tasks] == [("done", 1), ("done", 2), ("done", 2)]
+
+def test_outbox_purge_deletes_old_finished_tasks_in_batches(app):
+    @outbox.handler("noop", "test.noop")
+    def noop(payload):
+        pass
+
+    with app.app_context():
+        for n in range(4):
+            outbox.publish("test.noop", {"n": n})
+        db.session.commit()
+        drain_once()
+        outbox.publish("test.noop", {"n": 4})
+        db.session.commit()
+        tasks = OutboxTask.query.order_by(OutboxTask.id).all()
+        tasks[0].status = "failed"
+        for task in tasks[:3] + tasks[4:]:
+            task.available_at = utcnow() - timedelta(days=8)
+        db.session.commit()
+
+        # Old done/failed rows go; recent ones and anything still pending stay
+        assert outbox.purge(retention_days=7, batch_size=2) == 3
+        assert [(t.id, t.status) for t in OutboxTask.query.order_by(OutboxTask.id)] == [(4, "done"), (5, "pending")]
+        assert outbox.purge(retention_days=7) == 0
+
+    # The worker purges with the configured retention (what `worker.py --purge` runs)
+    app.config["OUTBOX_RETENTION_DAYS"] = 0.5
+    assert outbox.OutboxWorker(app).purge() == 0
+    with app.app_context():
+        OutboxTask.query.filter_by(id=4).update({"available_at": utcnow() - timedelta(days=1)})
+        db.session.commit()
+    assert outbox.OutboxWorker(app).purge() == 1
+
+def test_inprocess_outbox_worker_starts_on_first_request():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "JWT_SECRET_KEY": "test-secret",
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        "OUTBOX_INPROCESS_WORKER": True,
+        "OUTBOX_POLL_INTERVAL": 0.01
+    })
+    worker = app.extensions["outbox_worker"]
+
+    def outbox_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("outbox-worker-")]
+    # Nothing runs at import/preload time, i.e. in a pre-forking master
+    assert not worker.running and not outbox_threads()
+    with app.app_context():
+        db.create_all()
+    try:
+        assert app.test_client().get("/").status_code == 200
+        app.test_client().get("/")
+        assert worker.running and len(outbox_threads()) == worker.threads
+    finally:
+        worker.stop()
+
+# -------- SEAT MAP ----------
+def test_seatmap_layout_and_availability(client, user_token):
+    event = client.post("/events/", json={"title": "E5", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    tickets = [
+        client.post("/tickets/", json={"event_id": event["id"], "price": 20.0, "seat": f"A{i}"}, headers=auth_header(user_token)).get_json()
+        for i in range(10)
+    ]
+
+    res = client.get(f"/events/{event['id']}/seatmap/layout")
+    assert res.status_code == 200
+    layout = res.get_json()
+    assert layout["count"] == 10 and layout["ticket_ids"] == [t["id"] for t in tickets]
+    assert layout["seats"][3] == "A3"
+    # Layout is cacheable by version
+    res304 = client.get(f"/events/{event['id']}/seatmap/layout", headers={"If-None-Match": f'"{layout["version"]}"'})
+    assert res304.status_code == 304
+
+    avail = client.get(f"/events/{event['id']}/seatmap/availability").get_json()
+    assert avail["version"] == layout["version"]
+    assert base64.b64decode(avail["bitmap"]) == b"\xff\x03"
+
+    # Booking ordinal 3 clears bit 3; cancelling sets it again
+    booking = client.post("/bookings/", json={"ticket_id": tickets[3]["id"]}, headers=auth_header(user_token)).get_json()
+    res_bin = client.get(f"/events/{event['id']}/seatmap/availability?format=binary&compress=zlib")
+    assert res_bin.mimetype == "application/octet-stream"
+    assert res_bin.headers["X-Seat-Count"] == "10"
+    assert zlib.decompress(res_bin.data) == b"\xf7\x03"
+    client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(user_token))
+    res_bin = client.get(f"/events/{event['id']}/seatmap/availability?format=binary")
+    assert res_bin.data == b"\xff\x03"
+
+    # Layout changes bump the version
+    client.put(f"/tickets/{tickets[0]['id']}", json={"seat": "Z9"}, headers=auth_header(user_token))
+    layout2 = client.get(f"/events/{event['id']}/seatmap/layout").get_json()
+    assert layout2["version"] != layout["version"] and layout2["seats"][0] == "Z9"
+
+def test_seatmap_errors(client):
+    assert client.get("/events/4242/seatmap/layout").status_code == 404
+    assert client.get("/events/4242/seatmap/availability").status_code == 404
+    assert client.get("/events/4242/seatmap/availability?format=xml").status_code == 400
+
+def run_after_next_select(action):
+    """Run `action` right after the next SELECT on the app's engine, i.e. while its result is in flight."""
+    pending = [action]
+
+    def hook(conn, clauseelement, *args):
+        if pending and getattr(clauseelement, "is_select", False):
+            pending.pop()()
+    sa_event.listen(db.engine, "after_execute", hook)
+
+def test_seat_index_keeps_updates_racing_a_rebuild(app, client, user_token):
+    event = client.post("/events/", json={"title": "E6", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    tickets = [
+        client.post("/tickets/", json={"event_id": event["id"], "price": 5.0, "seat": f"B{i}"}, headers=auth_header(user_token)).get_json()
+        for i in range(3)
+    ]
+    with app.app_context():
+        index = SeatIndex(max_age=0)
+        # A booking lands while the snapshot read is in flight
+        run_after_next_select(lambda: index.set_booked(event["id"], tickets[1]["id"], True))
+        assert bytes(index.get(event["id"]).bits) == b"\x05"
+
+        def reseat():
+            Ticket.query.get(tickets[0]["id"]).seat = "Z0"
+            db.session.commit()
+            index.invalidate(event["id"])
+        # A ticket is re-seated (and the index invalidated) after the read
+        index.invalidate(event["id"])
+        run_after_next_select(reseat)
+        seats = index.get(event["id"])
+        # The stale snapshot was discarded and the rebuild retried
+        assert seats.seats[0] == "Z0" and index.get(event["id"]) is seats
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+def test_seat_index_refreshes_stale_entries_in_background(app, client, user_token):
+    event = client.post("/events/", json={"title": "E7", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    tickets = [
+        client.post("/tickets/", json={"event_id": event["id"], "price": 5.0}, headers=auth_header(user_token)).get_json()
+        for _ in range(2)
+    ]
+    with app.app_context():
+        index = SeatIndex(max_age=0.05)
+        first = index.get(event["id"])
+        assert bytes(first.bits) == b"\x03"
+        # Booked by another process: only the database knows
+        Ticket.query.get(tickets[0]["id"]).is_booked = True
+        db.session.commit()
+        time.sleep(0.06)
+        assert bytes(index.get(event["id"]).bits) == b"\x03"  # served stale, refresh started
+        wait_until(lambda: bytes(index.get(event["id"]).bits) == b"\x02")
+        # Only availability was re-read, into the existing layout
+        assert index.get(event["id"]) is first
+
+        # A ticket added by another process moves ordinals: the layout is rebuilt
+        db.session.add(Ticket(event_id=event["id"], price=5.0))
+        db.session.commit()
+        time.sleep(0.06)
+        wait_until(lambda: len(index.get(event["id"])) == 3)
+        assert bytes(index.get(event["id"]).bits) == b"\x06"
+
+def test_seat_index_evicts_least_recently_used_events(app, client, user_token):
+    events = []
+    for i in range(3):
+        event = client.post("/events/", json={"title": f"L{i}", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+        client.post("/tickets/", json={"event_id": event["id"], "price": 5.0}, headers=auth_header(user_token))
+        events.append(event["id"])
+    with app.app_context():
+        index = SeatIndex(max_age=0, max_events=2)
+        first, second = index.get(events[0]), index.get(events[1])
+        assert index.get(events[0]) is first  # now the most recently used
+        index.get(events[2])
+        assert index.get(events[0]) is first
+        assert index.get(events[1]) is not second  # evicted, rebuilt on access
+
+# -------- WAITLIST ----------
+def make_user_token(client, name):
+    client.post("/auth/signup", json={"username": name, "email": f"{name}@example.com", "password": "pw12345"})
+    return client.post("/auth/login", json={"username": name, "password": "pw12345"}).get_json()["access_token"]
+
+def test_waitlist_promotion_on_cancellation(app, client, user_token):
+    token2, token3 = make_user_token(client, "w2"), make_user_token(client, "w3")
+    event = client.post("/events/", json={"title": "Sold out", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    ticket = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+
+    # Cannot join while tickets are available
+    res = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2))
+    assert res.status_code == 409
+    booking = client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(user_token)).get_json()
+
+    e2 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2))
+    e3 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token3))
+    assert e2.status_code == 201 and e2.get_json()["position"] == 1
+    assert e3.status_code == 201 and e3.get_json()["position"] == 2
+    assert client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2)).status_code == 409
+    e2, e3 = e2.get_json(), e3.get_json()
+
+    # Cancellation hands the ticket to the head of the queue; it stays held
+    client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(user_token))
+    offered = client.get(f"/waitlist/{e2['entry_id']}", headers=auth_header(token2)).get_json()
+    assert offered["status"] == "offered" and offered["ticket_id"] == ticket["id"]
+    assert client.get(f"/waitlist/{e3['entry_id']}", headers=auth_header(token3)).get_json()["position"] == 1
+    assert client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(user_token)).status_code == 409
+    assert client.post(f"/waitlist/{e3['entry_id']}/claim", headers=auth_header(token3)).status_code == 409
+    assert client.get(f"/waitlist/{e2['entry_id']}", headers=auth_header(token3)).status_code == 404
+
+    res = client.post(f"/waitlist/{e2['entry_id']}/claim", headers=auth_header(token2))
+    assert res.status_code == 201
+    claimed = res.get_json()
+    assert client.get("/bookings/", headers=auth_header(token2)).get_json()[0]["ticket_id"] == ticket["id"]
+
+    # Next cancellation offers to user 3; an expired claim window passes the ticket on (nobody left: freed)
+    client.delete(f"/bookings/{claimed['booking_id']}", headers=auth_header(token2))
+    with app.app_context():
+        entry = WaitlistEntry.query.get(e3["entry_id"])
+        assert entry.status == "offered"
+        entry.offer_expires_at = utcnow()
+        OutboxTask.query.filter_by(event="waitlist.offer_expiry").update({"available_at": utcnow()})
+        db.session.commit()
+        drain_once()
+        assert WaitlistEntry.query.get(e3["entry_id"]).status == "expired"
+        assert Ticket.query.get(ticket["id"]).is_booked is False
+    assert client.post(f"/waitlist/{e3['entry_id']}/claim", headers=auth_header(token3)).status_code == 409
+    assert client.get("/waitlist/", headers=auth_header(token3)).get_json() == []
+
+def test_waitlist_leave_passes_offer_on(app, client, user_token):
+    token2, token3 = make_user_token(client, "l2"), make_user_token(client, "l3")
+    event = client.post("/events/", json={"title": "Sold out 2", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    ticket = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+    booking = client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(user_token)).get_json()
+    e2 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2)).get_json()
+    e3 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token3)).get_json()
+    client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(user_token))
+
+    # Declining the offer moves it to the next in line
+    assert client.delete(f"/waitlist/{e2['entry_id']}", headers=auth_header(token2)).status_code == 200
+    assert client.get(f"/waitlist/{e3['entry_id']}", headers=auth_header(token3)).get_json()["status"] == "offered"
+    assert client.delete(f"/waitlist/{e2['entry_id']}", headers=auth_header(token2)).status_code == 404
+    # Expired window on claim: 410 and the ticket becomes bookable again
+    with app.app_context():
+        WaitlistEntry.query.get(e3["entry_id"]).offer_expires_at = utcnow()
+        db.session.commit()
+    assert client.post(f"/waitlist/{e3['entry_id']}/claim", headers=auth_header(token3)).status_code == 410
+    assert client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(user_token)).status_code == 201
+
+def test_waitlist_entries_do_not_pin_deleted_tickets(app, client, user_token):
+    with app.app_context():
+        # Enforce foreign keys like MySQL does (in-memory DB: one shared connection)
+        db.session.execute(text("PRAGMA foreign_keys=ON"))
+        db.session.commit()
+    token2, token3 = make_user_token(client, "f2"), make_user_token(client, "f3")
+    event = client.post("/events/", json={"title": "Sold out 3", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    t1 = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+    t2 = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+    b1 = client.post("/bookings/", json={"ticket_id": t1["id"]}, headers=auth_header(user_token)).get_json()
+    b2 = client.post("/bookings/", json={"ticket_id": t2["id"]}, headers=auth_header(user_token)).get_json()
+    e2 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2)).get_json()
+    e3 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token3)).get_json()
+
+    # Claimed offer: once the claimed booking is cancelled the ticket can be deleted
+    client.delete(f"/bookings/{b1['booking_id']}", headers=auth_header(user_token))
+    claimed = client.post(f"/waitlist/{e2['entry_id']}/claim", headers=auth_header(token2)).get_json()
+    with app.app_context():
+        assert WaitlistEntry.query.get(e2["entry_id"]).ticket_id is None
+    client.delete(f"/bookings/{claimed['booking_id']}", headers=auth_header(token2))  # offered to user 3
+    client.delete(f"/waitlist/{e3['entry_id']}", headers=auth_header(token3))  # declined: ticket freed
+    assert client.delete(f"/tickets/{t1['id']}", headers=auth_header(user_token)).status_code == 200
+
+    # Deleting a ticket while it is on offer puts the entry back at the head of the queue
+    e4 = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token3)).get_json()
+    client.delete(f"/bookings/{b2['booking_id']}", headers=auth_header(user_token))
+    assert client.get(f"/waitlist/{e4['entry_id']}", headers=auth_header(token3)).get_json()["status"] == "offered"
+    assert client.delete(f"/tickets/{t2['id']}", headers=auth_header(user_token)).status_code == 200
+    requeued = client.get(f"/waitlist/{e4['entry_id']}", headers=auth_header(token3)).get_json()
+    assert requeued["status"] == "waiting" and requeued["position"] == 1
+    with app.app_context():
+        db.session.execute(text("PRAGMA foreign_keys=OFF"))  # ticket <-> booking cycle would block drop_all
+        db.session.commit()
+
+def test_waitlist_new_tickets_and_event_deletion(app, client, user_token):
+    with app.app_context():
+        # Enforce foreign keys like MySQL does (in-memory DB: one shared connection)
+        db.session.execute(text("PRAGMA foreign_keys=ON"))
+        db.session.commit()
+    token2 = make_user_token(client, "n2")
+    event = client.post("/events/", json={"title": "Added late", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    # No tickets at all is not "sold out"
+    assert client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2)).status_code == 409
+
+    t1 = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+    booking = client.post("/bookings/", json={"ticket_id": t1["id"]}, headers=auth_header(user_token)).get_json()
+    entry = client.post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(token2)).get_json()
+    # A ticket added to a sold-out event is offered to the queue, not sold to anyone
+    t2 = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(user_token)).get_json()
+    assert t2["is_booked"] is True
+    offered = client.get(f"/waitlist/{entry['entry_id']}", headers=auth_header(token2)).get_json()
+    assert offered["status"] == "offered" and offered["ticket_id"] == t2["id"]
+    assert client.post("/bookings/", json={"ticket_id": t2["id"]}, headers=auth_header(user_token)).status_code == 409
+
+    # Finished waitlist entries do not block deleting the event
+    client.delete(f"/waitlist/{entry['entry_id']}", headers=auth_header(token2))
+    client.delete(f"/bookings/{booking['booking_id']}", headers=auth_header(user_token))
+    for ticket in (t1, t2):
+        assert client.delete(f"/tickets/{ticket['id']}", headers=auth_header(user_token)).status_code == 200
+    assert client.delete(f"/events/{event['id']}", headers=auth_header(user_token)).status_code == 200
+    with app.app_context():
+        assert WaitlistEntry.query.filter_by(event_id=event["id"]).count() == 0
+        db.session.execute(text("PRAGMA foreign_keys=OFF"))  # ticket <-> booking cycle would block drop_all
+        db.session.commit()
+
+def test_waitlist_one_active_entry_per_user(app, client, user_token):
+    event = client.post("/events/", json={"title": "Sold out 4", "date": "2024-06-01T14:00:00"}, headers=auth_header(user_token)).get_json()
+    with app.app_context():
+        # Two submits that both passed the route's "already waiting?" check
+        first = waitlist.join(event["id"], 1)
+        assert first is not None
+        assert waitlist.join(event["id"], 1) is None
+        assert WaitlistEntry.query.filter_by(event_id=event["id"], user_id=1).count() == 1
+        # Finished entries do not block joining again
+        waitlist.close(first, "left")
+        db.session.commit()
+        assert waitlist.join(event["id"], 1).seq == 2
+
+def test_waitlist_concurrent_joins_get_distinct_positions(tmp_path, user_data):
+    # A file database so every thread has its own connection
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'waitlist.db'}",
+        "JWT_SECRET_KEY": "test-secret",
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False
+    })
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    client.post("/auth/signup", json=user_data)
+    token = client.post("/auth/login", json={"username": user_data["username"], "password": user_data["password"]}).get_json()["access_token"]
+    event = client.post("/events/", json={"title": "Rush", "date": "2024-06-01T14:00:00"}, headers=auth_header(token)).get_json()
+    ticket = client.post("/tickets/", json={"event_id": event["id"], "price": 30.0}, headers=auth_header(token)).get_json()
+    client.post("/bookings/", json={"ticket_id": ticket["id"]}, headers=auth_header(token))
+    tokens = [make_user_token(client, f"rush{i}") for i in range(16)]
+
+    barrier = threading.Barrier(len(tokens))
+
+    def join(user_token):
+        barrier.wait()
+        return app.test_client().post("/waitlist/", json={"event_id": event["id"]}, headers=auth_header(user_token))
+    with ThreadPoolExecutor(len(tokens)) as pool:
+        responses = list(pool.map(join, tokens))
+
+    assert [r.status_code for r in responses] == [201] * len(tokens)
+    assert sorted(r.get_json()["position"] for r in responses) == list(range(1, len(tokens) + 1))
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from seed_db import seed_database
+
+
+def test_seed_database_is_deterministic(tmp_path):
+    snapshots = []
+    for workers in (1, 2):
+        uri = f"sqlite:///{tmp_path / f'seed{workers}.db'}"
+        seed_database(uri, users=200, events=20, tickets=3000, booking_ratio=0.5, seed=7, chunk_size=500, workers=workers)
+        with create_engine(uri).connect() as conn:
+            snapshots.append([
+                conn.execute(text(q)).fetchall() for q in (
+                    "SELECT COUNT(*), SUM(is_booked), SUM(price) FROM ticket",
+                    "SELECT COUNT(*), SUM(user_id), MAX(user_id) FROM booking",
+                    "SELECT COUNT(*) FROM ticket t JOIN booking b ON b.id = t.booking_id AND b.ticket_id = t.id",
+                    "SELECT COUNT(*) FROM user"
+                )
+            ])
+    assert snapshots[0] == snapshots[1]
+    tickets, bookings, linked, users = snapshots[0]
+    assert 0.4 < tickets[0][1] / tickets[0][0] < 0.6
+    assert bookings[0][0] == linked[0][0] == tickets[0][1]
+    assert bookings[0][2] <= 200 and users[0][0] == 200
+
+
+def test_seed_database_rejects_empty_counts(tmp_path):
+    uri = f"sqlite:///{tmp_path / 'empty.db'}"
+    for counts in ({"users": 0, "events": 5, "tickets": 50}, {"users": 5, "events": 0, "tickets": 50}):
+        with pytest.raises(ValueError):
+            seed_database(uri, **counts)
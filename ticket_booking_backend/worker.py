@@ -0,0 +1,49 @@
+import argparse
+import logging
+import signal
+
+from app import create_app
+from app.outbox import OutboxWorker
+
+# PUBLIC_INTERFACE
+def run_worker():
+    """
+    Standalone outbox worker: drains booking side effects (emails, ticket PDFs,
+    analytics) using the production config. Stops cleanly on SIGINT/SIGTERM.
+    """
+    parser = argparse.ArgumentParser(description="Drain the booking side-effect outbox")
+    parser.add_argument("--threads", type=int, help="worker threads (default: OUTBOX_WORKER_THREADS)")
+    parser.add_argument("--batch-size", type=int, help="tasks claimed per batch (default: OUTBOX_BATCH_SIZE)")
+    parser.add_argument("--poll-interval", type=float, help="seconds to sleep when idle (default: OUTBOX_POLL_INTERVAL)")
+    parser.add_argument("--once", action="store_true", help="drain until the outbox is empty, then exit")
+    parser.add_argument("--purge", action="store_true",
+                        help="delete finished tasks older than OUTBOX_RETENTION_DAYS, then exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(threadName)s %(levelname)s %(message)s")
+    app = create_app()
+    worker = OutboxWorker(app, threads=args.threads, batch_size=args.batch_size, poll_interval=args.poll_interval)
+
+    if args.purge:
+        print(f"Purged {worker.purge()} finished outbox tasks.")
+        return
+
+    if args.once:
+        total = 0
+        while True:
+            processed = worker.drain()
+            if not processed:
+                break
+            total += processed
+        print(f"Processed {total} outbox tasks.")
+        return
+
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+    worker.start()
+    print(f"Outbox worker running with {worker.threads} thread(s).")
+    while worker.running:
+        signal.pause()
+
+if __name__ == "__main__":
+    run_worker()